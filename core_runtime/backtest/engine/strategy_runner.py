@@ -152,6 +152,8 @@ class HftStrategyRunner:
     ) -> None:
         self.engine_cfg = engine_cfg
         self.strategy = strategy
+        # Optional strategy hook, told which accepted intents were actually dispatched.
+        self._on_intents_dispatched = getattr(strategy, "on_intents_dispatched", None)
         self._core_cfg = core_cfg
         self._enable_core_step_market_dispatch = enable_core_step_market_dispatch
         self._enable_core_step_control_time_dispatch = (
@@ -497,9 +499,11 @@ class HftStrategyRunner:
             for it, _ in execution_errors
         }
 
+        dispatched: list[OrderIntent] = []
         for it in accepted_now:
             if (it.instrument, it.client_order_id) in failed_keys:
                 continue
+            dispatched.append(it)
             if it.intent_type == "new":
                 self._process_canonical_order_submitted_event(
                     it,
@@ -517,6 +521,9 @@ class HftStrategyRunner:
                 it.intent_type,
             )
 
+        if self._on_intents_dispatched is not None:
+            self._on_intents_dispatched(dispatched)
+
         return execution_errors
 
     def run(
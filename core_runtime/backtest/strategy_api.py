@@ -6,7 +6,7 @@ Core no longer exports strategy construction interfaces; runtime owns these.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Mapping, Protocol, runtime_checkable
+from typing import Any, Mapping, Protocol, Sequence, runtime_checkable
 
 from tradingchassis_core.core.domain.state import StrategyState
 from tradingchassis_core.core.domain.types import MarketEvent, OrderIntent, RiskConstraints
@@ -14,7 +14,14 @@ from tradingchassis_core.core.domain.types import MarketEvent, OrderIntent, Risk
 
 @runtime_checkable
 class Strategy(Protocol):
-    """Runtime strategy callback contract."""
+    """Runtime strategy callback contract.
+
+    A strategy may additionally define ``on_intents_dispatched(intents)``; the runner
+    then calls it after each dispatch with the accepted intents that execution took
+    without error.
+    """
+
+    __slots__ = ()
 
     def on_feed(
         self,
@@ -22,7 +29,7 @@ class Strategy(Protocol):
         event: MarketEvent,
         engine_cfg: object,
         constraints: RiskConstraints,
-    ) -> list[OrderIntent]:
+    ) -> Sequence[OrderIntent]:
         """Return intents generated for one market event."""
 
     def on_order_update(
@@ -30,7 +37,7 @@ class Strategy(Protocol):
         state: StrategyState,
         engine_cfg: object,
         constraints: RiskConstraints,
-    ) -> list[OrderIntent]:
+    ) -> Sequence[OrderIntent]:
         """Return intents generated for one execution-feedback update."""
 
 
@@ -0,0 +1,79 @@
+"""Numba kernels for the DebugStrategyV1 hot path."""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+# Largest tick count accepted for any quote; keeps every int64 tick (and the
+# per-level offsets added to it) far from overflow.
+_MAX_ABS_TICKS = float(2**62)
+
+
+@njit(cache=True)
+def ladder_in_tick_range(
+    mid: float,
+    half_spread: float,
+    tick: float,
+    num_levels: int,
+    bid_book_px: np.ndarray,
+    ask_book_px: np.ndarray,
+    n_bid: int,
+    n_ask: int,
+) -> bool:
+    """Whether every quote `fill_level_ticks` would produce is a finite, int64-safe tick count.
+
+    `tick` must already be known to be positive and finite.
+    """
+    if not (np.isfinite(mid) and np.isfinite(half_spread)):
+        return False
+    if (abs(mid) + abs(half_spread)) / tick + num_levels >= _MAX_ABS_TICKS:
+        return False
+    for level in range(n_bid):
+        px = bid_book_px[level]
+        if not np.isfinite(px) or abs(px) / tick >= _MAX_ABS_TICKS:
+            return False
+    for level in range(n_ask):
+        px = ask_book_px[level]
+        if not np.isfinite(px) or abs(px) / tick >= _MAX_ABS_TICKS:
+            return False
+    return True
+
+
+@njit(cache=True)
+def fill_level_ticks(
+    out_ticks: np.ndarray,
+    mid: float,
+    half_spread: float,
+    tick: float,
+    num_levels: int,
+    bid_book_px: np.ndarray,
+    ask_book_px: np.ndarray,
+    n_bid: int,
+    n_ask: int,
+) -> None:
+    """Write bid/ask quotes for every level into `out_ticks` as integer tick counts.
+
+    `out_ticks` is interleaved per level (bid at 2 * level, ask at 2 * level + 1).
+    Levels present in the book use the observed price rounded to the tick; deeper
+    levels step one tick per level away from `mid -/+ half_spread`, which is
+    rounded to the tick grid once. Inputs must pass `ladder_in_tick_range`.
+    """
+    bid_base = np.int64(np.rint((mid - half_spread) / tick))
+    ask_base = np.int64(np.rint((mid + half_spread) / tick))
+    for level in range(num_levels):
+        if level < n_bid:
+            out_ticks[2 * level] = np.int64(np.rint(bid_book_px[level] / tick))
+        else:
+            out_ticks[2 * level] = bid_base - level
+        if level < n_ask:
+            out_ticks[2 * level + 1] = np.int64(np.rint(ask_book_px[level] / tick))
+        else:
+            out_ticks[2 * level + 1] = ask_base + level
+
+
+def warm_up() -> None:
+    """Compile (or load from the on-disk cache) the kernels before the first event."""
+    empty = np.empty(0, dtype=np.float64)
+    ladder_in_tick_range(1.0, 0.0, 1.0, 1, empty, empty, 0, 0)
+    fill_level_ticks(np.empty(2, dtype=np.int64), 1.0, 0.0, 1.0, 1, empty, empty, 0, 0)
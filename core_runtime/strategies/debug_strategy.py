@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import math
+from functools import partial
+from typing import TYPE_CHECKING, Sequence
+
+import numpy as np
 
 if TYPE_CHECKING:
     from tradingchassis_core import MarketEvent, RiskConstraints, StrategyState
@@ -16,13 +20,52 @@ from tradingchassis_core import (
 )
 
 from core_runtime.backtest.strategy_api import Strategy
+from core_runtime.strategies._debug_kernels import (
+    fill_level_ticks,
+    ladder_in_tick_range,
+    warm_up,
+)
 
 _SLOT_NAMESPACE = "debug_strategy_v1"
 
+# Returned whenever there is nothing to quote, so quiet events allocate nothing.
+_EMPTY_INTENTS: tuple[OrderIntent, ...] = ()
+
+# Slot id derivation with the strategy namespace bound once.
+_slot_order_id = partial(stable_slot_order_id, namespace=_SLOT_NAMESPACE)
+
+# Per-event slot buffers are interleaved: slot 2 * level is the bid, 2 * level + 1 the ask.
+_SLOT_SIDES = ("buy", "sell")
+
+# Quoted prices repeat heavily between events; beyond this many distinct values the
+# Price pool is simply dropped and rebuilt.
+_PRICE_POOL_MAX = 4096
+
 
 class DebugStrategyV1(Strategy):
     """Very simple market making example strategy."""
 
+    __slots__ = (
+        "spread",
+        "order_qty",
+        "use_price_tick_levels",
+        "post_only",
+        "intents_on_event",
+        "intents_after_risk",
+        "_risk_spare",
+        "_qty",
+        "_price_pool",
+        "_id_cache",
+        "_buf_ticks",
+        "_buf_px",
+        "_buf_is_replace",
+        "_buf_bid_book_px",
+        "_buf_ask_book_px",
+        "_last_quote_key",
+        "_last_ticks",
+        "_undispatched",
+    )
+
     def __init__(
         self,
         spread: float,
@@ -35,150 +78,225 @@ class DebugStrategyV1(Strategy):
         self.use_price_tick_levels = use_price_tick_levels
         self.post_only = post_only
 
-        self.intents_on_event: list[OrderIntent] = []
+        self.intents_on_event: Sequence[OrderIntent] = _EMPTY_INTENTS
         self.intents_after_risk: list[OrderIntent] = []
+        # Swapped with intents_after_risk on every risk decision (double buffer).
+        self._risk_spare: list[OrderIntent] = []
+
+        # Price and Quantity are immutable, so intents can share instances.
+        self._qty = Quantity(value=order_qty, unit="contracts")
+        self._price_pool: dict[float, Price] = {}
+
+        # Slot order ids only depend on (instrument, num_levels), so hash them once.
+        self._id_cache: dict[tuple[str, int], list[str]] = {}
+
+        # Reused per-slot buffers; grown on demand when the level count increases.
+        self._buf_ticks = np.empty(0, dtype=np.int64)
+        self._buf_px = np.empty(0, dtype=np.float64)
+        self._buf_is_replace = np.empty(0, dtype=np.bool_)
+        self._buf_bid_book_px = np.empty(0, dtype=np.float64)
+        self._buf_ask_book_px = np.empty(0, dtype=np.float64)
+
+        # Ticks of the last emitted ladder, keyed by (instrument, num_levels, tick, qty), and
+        # the (client_order_id, price) pairs of it the runner has not yet reported as
+        # dispatched. The ladder only counts as quoted once that set is empty.
+        self._last_quote_key: tuple[str, int, float, float] | None = None
+        self._last_ticks = np.empty(0, dtype=np.int64)
+        self._undispatched: set[tuple[str, float]] = set()
+
+        warm_up()
 
     def round_to_tick(self, price: float, tick: float) -> float:
         if tick <= 0:
             raise ValueError("tick must be positive")
         return round(price / tick) * tick
 
+    def _ids_for(self, instrument: str, num_levels: int) -> list[str]:
+        key = (instrument, num_levels)
+        ids = self._id_cache.get(key)
+        if ids is None:
+            ids = [
+                _slot_order_id(SlotKey(instrument=instrument, side=side, level_index=level))
+                for level in range(num_levels)
+                for side in _SLOT_SIDES
+            ]
+            self._id_cache[key] = ids
+        return ids
+
     def on_feed(
         self,
         state: StrategyState,
         event: MarketEvent,
         engine_cfg: object,
         constraints: RiskConstraints,
-    ) -> list[OrderIntent]:
+    ) -> Sequence[OrderIntent]:
         """Feed-triggered logic (rc=2). Inputs are read-only for Strategy, otherwise considered a bug."""
 
-        self.intents_on_event = []
-
         # NOTE: keep existing logic as-is for now; we will align field names/types later.
         # This block is only to satisfy the new interface.
-        if not constraints.trading_enabled:
-            return self.intents_on_event
+        #
+        # Single early-out: trading disabled, not a book event, or a one-sided book.
+        # Cheapest checks first.
+        book = event.book
+        if (
+            not constraints.trading_enabled
+            or book is None
+            or not event.is_book()
+            or not book.bids
+            or not book.asks
+        ):
+            self.intents_on_event = _EMPTY_INTENTS
+            return _EMPTY_INTENTS
 
-        if not event.is_book() or event.book is None:
-            return self.intents_on_event
+        ts = event.ts_ns_local
+        bids = book.bids
+        asks = book.asks
 
-        if not event.book.bids or not event.book.asks:
-            return self.intents_on_event
+        num_levels = int(self.use_price_tick_levels)
+        if num_levels <= 0:
+            num_levels = 1
+
+        num_slots = 2 * num_levels
+        if self._buf_px.shape[0] < num_slots:
+            self._buf_ticks = np.empty(num_slots, dtype=np.int64)
+            self._buf_px = np.empty(num_slots, dtype=np.float64)
+            self._buf_is_replace = np.empty(num_slots, dtype=np.bool_)
+            self._buf_bid_book_px = np.empty(num_levels, dtype=np.float64)
+            self._buf_ask_book_px = np.empty(num_levels, dtype=np.float64)
+            self._last_ticks = np.empty(num_slots, dtype=np.int64)
+            self._last_quote_key = None
+        buf_ticks = self._buf_ticks[:num_slots]
+        buf_px = self._buf_px[:num_slots]
+        buf_is_replace = self._buf_is_replace[:num_slots]
+        bid_book_px = self._buf_bid_book_px
+        ask_book_px = self._buf_ask_book_px
 
-        best_bid = float(event.book.bids[0].price.value)
-        best_ask = float(event.book.asks[0].price.value)
-        mid = 0.5 * (best_bid + best_ask)
+        # Read each observed price once; the float64 buffers are then the only
+        # source for mid and for the price kernel.
+        n_bid = min(num_levels, len(bids))
+        n_ask = min(num_levels, len(asks))
+        bid_book_px[:n_bid] = [level.price.value for level in bids[:n_bid]]
+        ask_book_px[:n_ask] = [level.price.value for level in asks[:n_ask]]
+        mid = 0.5 * (bid_book_px[0] + ask_book_px[0])
 
         tick = float(engine_cfg.tick_size)
+        if not 0.0 < tick < math.inf:
+            raise ValueError("tick must be positive and finite")
         tif = "POST_ONLY" if self.post_only else "GTC"
-
-        num_levels = int(self.use_price_tick_levels)
-        if num_levels <= 0:
-            num_levels = 1
+        half_spread = 0.5 * self.spread
+        qty = self._qty
+        if qty.value != self.order_qty:
+            # order_qty is public; rebuild the shared Quantity if it was changed.
+            qty = self._qty = Quantity(value=self.order_qty, unit="contracts")
 
         instrument = str(event.instrument)
 
-        def is_slot_busy(client_order_id: str) -> bool:
-            return (
-                state.has_working_order(instrument, client_order_id)
-                or state.has_inflight(instrument, client_order_id)
-                or state.has_queued_intent(instrument, client_order_id)
-            )
+        # Quotes are computed on the integer tick grid and turned into prices once.
+        if not ladder_in_tick_range(
+            mid, half_spread, tick, num_levels, bid_book_px, ask_book_px, n_bid, n_ask
+        ):
+            raise ValueError("book prices and spread must be finite and within int64 ticks")
+        fill_level_ticks(
+            buf_ticks, mid, half_spread, tick, num_levels, bid_book_px, ask_book_px, n_bid, n_ask
+        )
 
-        def bid_price_for_level(level_index: int) -> float:
-            if level_index < len(event.book.bids):
-                px = float(event.book.bids[level_index].price.value)
-            else:
-                px = mid - (self.spread * 0.5) - (float(level_index) * tick)
-            return self.round_to_tick(px, tick)
+        # Busy mask for every slot in one pass, with the state lookups bound once.
+        ids = self._ids_for(instrument, num_levels)
+        has_working_order = state.has_working_order
+        has_inflight = state.has_inflight
+        has_queued_intent = state.has_queued_intent
+        buf_is_replace[:] = [
+            has_working_order(instrument, client_order_id)
+            or has_inflight(instrument, client_order_id)
+            or has_queued_intent(instrument, client_order_id)
+            for client_order_id in ids
+        ]
 
-        def ask_price_for_level(level_index: int) -> float:
-            if level_index < len(event.book.asks):
-                px = float(event.book.asks[level_index].price.value)
-            else:
-                px = mid + (self.spread * 0.5) + (float(level_index) * tick)
-            return self.round_to_tick(px, tick)
-
-        intents: list[OrderIntent] = []
-
-        for level in range(num_levels):
-            bid_slot = SlotKey(instrument=instrument, side="buy", level_index=level)
-            ask_slot = SlotKey(instrument=instrument, side="sell", level_index=level)
-
-            bid_id = stable_slot_order_id(bid_slot, namespace=_SLOT_NAMESPACE)
-            ask_id = stable_slot_order_id(ask_slot, namespace=_SLOT_NAMESPACE)
-
-            bid_px = bid_price_for_level(level)
-            ask_px = ask_price_for_level(level)
-
-            if is_slot_busy(bid_id):
-                intents.append(
-                    ReplaceOrderIntent(
-                        ts_ns_local=event.ts_ns_local,
-                        instrument=instrument,
-                        client_order_id=bid_id,
-                        intent_type="replace",
-                        order_type="limit",
-                        side="buy",
-                        intended_price=Price(currency="UNKNOWN", value=bid_px),
-                        intended_qty=Quantity(value=self.order_qty, unit="contracts"),
-                    )
-                )
-            else:
-                intents.append(
-                    NewOrderIntent(
-                        ts_ns_local=event.ts_ns_local,
-                        instrument=instrument,
-                        client_order_id=bid_id,
-                        intent_type="new",
-                        order_type="limit",
-                        side="buy",
-                        intended_price=Price(currency="UNKNOWN", value=bid_px),
-                        intended_qty=Quantity(value=self.order_qty, unit="contracts"),
-                        time_in_force=tif,
-                    )
-                )
+        # Every slot already has an order at exactly the ladder we quoted last time, and
+        # all of that ladder was dispatched: the replaces would be no-ops, so emit nothing.
+        quote_key = (instrument, num_levels, tick, qty.value)
+        last_ticks = self._last_ticks[:num_slots]
+        if (
+            quote_key == self._last_quote_key
+            and not self._undispatched
+            and buf_is_replace.all()
+            and np.array_equal(buf_ticks, last_ticks)
+        ):
+            self.intents_on_event = _EMPTY_INTENTS
+            return _EMPTY_INTENTS
+        self._last_quote_key = quote_key
+        last_ticks[:] = buf_ticks
+
+        np.multiply(buf_ticks, tick, out=buf_px)
 
-            if is_slot_busy(ask_id):
-                intents.append(
-                    ReplaceOrderIntent(
-                        ts_ns_local=event.ts_ns_local,
-                        instrument=instrument,
-                        client_order_id=ask_id,
-                        intent_type="replace",
-                        order_type="limit",
-                        side="sell",
-                        intended_price=Price(currency="UNKNOWN", value=ask_px),
-                        intended_qty=Quantity(value=self.order_qty, unit="contracts"),
-                    )
+        # Materialize intents only once every slot has been decided, straight into
+        # a list sized for every slot.
+        intents: list[OrderIntent] = [None] * num_slots  # type: ignore[list-item]
+
+        price_pool = self._price_pool
+        if len(price_pool) > _PRICE_POOL_MAX:
+            price_pool.clear()
+        undispatched = self._undispatched = set()
+
+        for slot, (px, is_replace) in enumerate(zip(buf_px.tolist(), buf_is_replace.tolist())):
+            side = _SLOT_SIDES[slot & 1]
+            price = price_pool.get(px)
+            if price is None:
+                price = price_pool[px] = Price(currency="UNKNOWN", value=px)
+            undispatched.add((ids[slot], px))
+            if is_replace:
+                intents[slot] = ReplaceOrderIntent(
+                    ts_ns_local=ts,
+                    instrument=instrument,
+                    client_order_id=ids[slot],
+                    intent_type="replace",
+                    order_type="limit",
+                    side=side,
+                    intended_price=price,
+                    intended_qty=qty,
                 )
             else:
-                intents.append(
-                    NewOrderIntent(
-                        ts_ns_local=event.ts_ns_local,
-                        instrument=instrument,
-                        client_order_id=ask_id,
-                        intent_type="new",
-                        order_type="limit",
-                        side="sell",
-                        intended_price=Price(currency="UNKNOWN", value=ask_px),
-                        intended_qty=Quantity(value=self.order_qty, unit="contracts"),
-                        time_in_force=tif,
-                    )
+                intents[slot] = NewOrderIntent(
+                    ts_ns_local=ts,
+                    instrument=instrument,
+                    client_order_id=ids[slot],
+                    intent_type="new",
+                    order_type="limit",
+                    side=side,
+                    intended_price=price,
+                    intended_qty=qty,
+                    time_in_force=tif,
                 )
 
-        self.intents_on_event.extend(intents)
-        return self.intents_on_event
+        self.intents_on_event = intents
+        return intents
 
     def on_order_update(
         self,
         state: StrategyState,
         engine_cfg: object,
         constraints: RiskConstraints,
-    ) -> list[OrderIntent]:
+    ) -> Sequence[OrderIntent]:
         """Order-update-triggered logic (rc=3). Inputs are read-only for Strategy, otherwise considered a bug."""
-        return []
+        # Fills, cancels or venue rejects may have changed what is resting; quote the
+        # full ladder again on the next feed event.
+        self._last_quote_key = None
+        return _EMPTY_INTENTS
+
+    def on_intents_dispatched(self, intents: Sequence[OrderIntent]) -> None:
+        """Runner callback with the accepted intents that were dispatched without error."""
+        undispatched = self._undispatched
+        if not undispatched:
+            return
+        for intent in intents:
+            undispatched.discard((intent.client_order_id, intent.intended_price.value))
 
     def on_risk_decision(self, decision: object) -> None:
-        accepted_now = getattr(decision, "accepted_now", [])
-        self.intents_after_risk = list(accepted_now)
+        accepted_now = getattr(decision, "accepted_now", _EMPTY_INTENTS)
+        # Refill the spare list and swap it in, so no list is allocated per decision.
+        # The list handed out by the previous call is reused on the next one.
+        intents_after_risk = self._risk_spare
+        intents_after_risk.clear()
+        intents_after_risk.extend(accepted_now)
+        self._risk_spare = self.intents_after_risk
+        self.intents_after_risk = intents_after_risk
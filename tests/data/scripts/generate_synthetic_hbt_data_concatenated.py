@@ -9,6 +9,7 @@ compatible with hftbacktest v2.x.
 from __future__ import annotations
 
 import os
+import zipfile
 
 import numpy as np
 from hftbacktest import (
@@ -20,6 +21,15 @@ from hftbacktest import (
     SELL_EVENT,
     TRADE_EVENT,
 )
+from numba import njit, prange
+
+# Event flags written by the generators, combined once at import time.
+_EV_SNAPSHOT_BID = np.uint64(EXCH_EVENT | DEPTH_SNAPSHOT_EVENT | BUY_EVENT)
+_EV_SNAPSHOT_ASK = np.uint64(EXCH_EVENT | DEPTH_SNAPSHOT_EVENT | SELL_EVENT)
+_EV_DEPTH_BID = np.uint64(EXCH_EVENT | LOCAL_EVENT | DEPTH_EVENT | BUY_EVENT)
+_EV_DEPTH_ASK = np.uint64(EXCH_EVENT | LOCAL_EVENT | DEPTH_EVENT | SELL_EVENT)
+_EV_TRADE_BID = np.uint64(EXCH_EVENT | LOCAL_EVENT | TRADE_EVENT | BUY_EVENT)
+_EV_TRADE_ASK = np.uint64(EXCH_EVENT | LOCAL_EVENT | TRADE_EVENT | SELL_EVENT)
 
 # ---------------------------------------------------------------------------
 # dtype used by hftbacktest v2.x
@@ -56,57 +66,147 @@ def make_synthetic_snapshot(
     n_rows = 2 * n_levels
     data = np.zeros(n_rows, dtype=DTYPE)
 
-    bid_flag = EXCH_EVENT | DEPTH_SNAPSHOT_EVENT | BUY_EVENT
-    ask_flag = EXCH_EVENT | DEPTH_SNAPSHOT_EVENT | SELL_EVENT
-
-    # Bid levels
-    for i in range(n_levels):
-        idx = i
-        price = mid_price - (i + 1) * tick_size
-        qty = (i + 1) * lot_size
-
-        data["ev"][idx] = bid_flag
-        data["exch_ts"][idx] = exch_ts
-        data["local_ts"][idx] = local_ts
-        data["px"][idx] = price
-        data["qty"][idx] = qty
-        data["order_id"][idx] = 0
-        data["ival"][idx] = 0
-        data["fval"][idx] = 0.0
-
-    # Ask levels
-    for i in range(n_levels):
-        idx = n_levels + i
-        price = mid_price + (i + 1) * tick_size
-        qty = (i + 1) * lot_size
-
-        data["ev"][idx] = ask_flag
-        data["exch_ts"][idx] = exch_ts
-        data["local_ts"][idx] = local_ts
-        data["px"][idx] = price
-        data["qty"][idx] = qty
-        data["order_id"][idx] = 0
-        data["ival"][idx] = 0
-        data["fval"][idx] = 0.0
+    levels = np.arange(n_levels)
+    offsets = (levels + 1) * tick_size
+    qtys = (levels + 1) * lot_size
+
+    bids = data[:n_levels]
+    bids["ev"] = _EV_SNAPSHOT_BID
+    bids["exch_ts"] = exch_ts
+    bids["local_ts"] = local_ts
+    bids["px"] = mid_price - offsets
+    bids["qty"] = qtys
+
+    asks = data[n_levels:]
+    asks["ev"] = _EV_SNAPSHOT_ASK
+    asks["exch_ts"] = exch_ts
+    asks["local_ts"] = local_ts
+    asks["px"] = mid_price + offsets
+    asks["qty"] = qtys
 
     return data
 
 
-def _depth_profile_qty(
-    level: int,
+def _depth_profile_qty_vec(
+    levels: np.ndarray,
     base_qty: float,
     profile: str = "linear",
-) -> float:
+) -> np.ndarray:
     """
-    Compute quantity for a given depth level.
+    Compute quantities for an array of depth levels.
     """
-    if profile == "flat":
-        return base_qty
+    levels = levels.astype(np.float64)
     if profile == "linear":
-        return base_qty * (level + 1)
+        return base_qty * (levels + 1.0)
     if profile == "exp":
-        return base_qty * np.exp(-level / 4.0)
-    return base_qty
+        return base_qty * np.exp(-levels / 4.0)
+    return np.full_like(levels, base_qty)
+
+
+@njit(cache=True)
+def _simulate_mid_path(
+    noise_ticks: np.ndarray,
+    base_price: float,
+    tick_size: float,
+) -> np.ndarray:
+    """
+    Random-walk the mid price, floored at one tick.
+    """
+    n_steps = noise_ticks.shape[0]
+    mid_path = np.empty(n_steps, dtype=np.float64)
+    mid_price = base_price
+
+    for step in range(n_steps):
+        mid_price += noise_ticks[step] * tick_size
+        mid_price = max(tick_size, mid_price)
+        mid_path[step] = mid_price
+
+    return mid_path
+
+
+@njit(cache=True, parallel=True)
+def _fill_events(
+    ev: np.ndarray,
+    exch_ts: np.ndarray,
+    local_ts: np.ndarray,
+    px: np.ndarray,
+    qty: np.ndarray,
+    best_bids: np.ndarray,
+    best_asks: np.ndarray,
+    level_offsets: np.ndarray,
+    level_qtys: np.ndarray,
+    step_starts: np.ndarray,
+    n_trades: np.ndarray,
+    trade_is_buy: np.ndarray,
+    trade_lots: np.ndarray,
+    base_exch_ts_ns: int,
+    interval_ns: int,
+    feed_latency_ns: int,
+    lot_size: float,
+) -> None:
+    """
+    Fill depth updates and trades for all steps, one step per prange task.
+    """
+    n_steps = best_bids.shape[0]
+    n_levels = level_offsets.shape[0]
+
+    for step in prange(n_steps):
+        ptr = step_starts[step]
+        step_exch_ts = base_exch_ts_ns + step * interval_ns
+        step_local_ts = step_exch_ts + feed_latency_ns
+        best_bid = best_bids[step]
+        best_ask = best_asks[step]
+
+        for level in range(n_levels):
+            ev[ptr] = _EV_DEPTH_BID
+            exch_ts[ptr] = step_exch_ts
+            local_ts[ptr] = step_local_ts
+            px[ptr] = best_bid - level_offsets[level]
+            qty[ptr] = level_qtys[level]
+            ptr += 1
+
+            ev[ptr] = _EV_DEPTH_ASK
+            exch_ts[ptr] = step_exch_ts
+            local_ts[ptr] = step_local_ts
+            px[ptr] = best_ask + level_offsets[level]
+            qty[ptr] = level_qtys[level]
+            ptr += 1
+
+        for trade in range(n_trades[step]):
+            if trade_is_buy[step, trade]:
+                ev[ptr] = _EV_TRADE_BID
+                px[ptr] = best_ask
+            else:
+                ev[ptr] = _EV_TRADE_ASK
+                px[ptr] = best_bid
+            exch_ts[ptr] = step_exch_ts
+            local_ts[ptr] = step_local_ts
+            qty[ptr] = trade_lots[step, trade] * lot_size
+            ptr += 1
+
+
+@njit(cache=True, parallel=True)
+def _pack_events(
+    out: np.ndarray,
+    ev: np.ndarray,
+    exch_ts: np.ndarray,
+    local_ts: np.ndarray,
+    px: np.ndarray,
+    qty: np.ndarray,
+) -> None:
+    """
+    Copy per-field arrays into `out`, one whole record per iteration.
+    """
+    for i in prange(out.shape[0]):
+        row = out[i]
+        row["ev"] = ev[i]
+        row["exch_ts"] = exch_ts[i]
+        row["local_ts"] = local_ts[i]
+        row["px"] = px[i]
+        row["qty"] = qty[i]
+        row["order_id"] = 0
+        row["ival"] = 0
+        row["fval"] = 0.0
 
 
 def make_synthetic_day(
@@ -125,68 +225,99 @@ def make_synthetic_day(
 ) -> np.ndarray:
     """
     Synthetic trading session producing depth updates and trades.
+    Rows are emitted in timestamp order, so no sort is needed.
     """
     rng = np.random.default_rng(42)
 
-    max_events_per_step = 2 * n_levels + max_trades_per_step
-    buffer = np.zeros(n_steps * max_events_per_step, dtype=DTYPE)
-    ptr = 0
-
-    mid_price = base_price
-
-    for step in range(n_steps):
-        exch_ts = base_exch_ts_ns + step * interval_ns
-        local_ts = exch_ts + feed_latency_ns
-
-        mid_price += rng.normal(scale=0.2) * tick_size
-        mid_price = max(tick_size, mid_price)
-
-        mid_rounded = round(mid_price / tick_size) * tick_size
-        best_bid = mid_rounded - tick_size
-        best_ask = mid_rounded + tick_size
-
-        for level in range(n_levels):
-            bid_px = best_bid - level * tick_size
-            ask_px = best_ask + level * tick_size
-            qty = _depth_profile_qty(level, lot_size, depth_profile)
-
-            buffer["ev"][ptr] = EXCH_EVENT | LOCAL_EVENT | DEPTH_EVENT | BUY_EVENT
-            buffer["exch_ts"][ptr] = exch_ts
-            buffer["local_ts"][ptr] = local_ts
-            buffer["px"][ptr] = bid_px
-            buffer["qty"][ptr] = qty
-            ptr += 1
+    levels = np.arange(n_levels)
+    level_offsets = levels * tick_size
+    level_qtys = _depth_profile_qty_vec(levels, lot_size, depth_profile)
+
+    noise_ticks = rng.normal(scale=0.2, size=n_steps)
+    trade_draws = rng.random((n_steps, max_trades_per_step)) < trade_prob
+    trade_is_buy = rng.random((n_steps, max_trades_per_step)) < 0.5
+    trade_lots = rng.integers(1, 10, size=(n_steps, max_trades_per_step))
+
+    mid_path = _simulate_mid_path(noise_ticks, base_price, tick_size)
+    mid_rounded = np.round(mid_path / tick_size) * tick_size
+    best_bids = mid_rounded - tick_size
+    best_asks = mid_rounded + tick_size
+    n_trades = np.cumprod(trade_draws, axis=1).sum(axis=1)
+
+    step_starts = np.zeros(n_steps + 1, dtype=np.int64)
+    np.cumsum(2 * n_levels + n_trades, out=step_starts[1:])
+    n_rows = int(step_starts[-1])
+
+    ev = np.empty(n_rows, dtype=np.uint64)
+    exch_ts = np.empty(n_rows, dtype=np.int64)
+    local_ts = np.empty(n_rows, dtype=np.int64)
+    px = np.empty(n_rows, dtype=np.float64)
+    qty = np.empty(n_rows, dtype=np.float64)
+
+    _fill_events(
+        ev,
+        exch_ts,
+        local_ts,
+        px,
+        qty,
+        best_bids,
+        best_asks,
+        level_offsets,
+        level_qtys,
+        step_starts,
+        n_trades,
+        trade_is_buy,
+        trade_lots,
+        base_exch_ts_ns,
+        interval_ns,
+        feed_latency_ns,
+        lot_size,
+    )
+    assert np.all(np.diff(exch_ts) >= 0)
 
-            buffer["ev"][ptr] = EXCH_EVENT | LOCAL_EVENT | DEPTH_EVENT | SELL_EVENT
-            buffer["exch_ts"][ptr] = exch_ts
-            buffer["local_ts"][ptr] = local_ts
-            buffer["px"][ptr] = ask_px
-            buffer["qty"][ptr] = qty
-            ptr += 1
+    data = np.empty(n_rows, dtype=DTYPE)
+    _pack_events(data, ev, exch_ts, local_ts, px, qty)
+    return data
 
-        trades = 0
-        while trades < max_trades_per_step and rng.random() < trade_prob:
-            is_buy = rng.random() < 0.5
-            side_flag = BUY_EVENT if is_buy else SELL_EVENT
 
-            buffer["ev"][ptr] = EXCH_EVENT | LOCAL_EVENT | TRADE_EVENT | side_flag
-            buffer["exch_ts"][ptr] = exch_ts
-            buffer["local_ts"][ptr] = local_ts
-            buffer["px"][ptr] = best_ask if is_buy else best_bid
-            buffer["qty"][ptr] = rng.integers(1, 10) * lot_size
+def merge_snapshot(snapshot_data: np.ndarray, day_data: np.ndarray) -> np.ndarray:
+    """
+    Insert a snapshot into a time-ordered event stream.
 
-            ptr += 1
-            trades += 1
+    The result is ordered by (exch_ts, local_ts) with the snapshot first on
+    full ties, as a stable sort of the concatenation would be. All snapshot
+    rows share one exch_ts/local_ts pair and `day_data` is already ordered by
+    (exch_ts, local_ts), so the merge is a single splice. An empty snapshot
+    leaves the day stream unchanged.
+    """
+    if len(snapshot_data) == 0:
+        return day_data
+
+    snap_exch_ts = snapshot_data["exch_ts"][0]
+    day_exch_ts = day_data["exch_ts"]
+    lo = np.searchsorted(day_exch_ts, snap_exch_ts, side="left")
+    hi = np.searchsorted(day_exch_ts, snap_exch_ts, side="right")
+    # Among day rows with the same exch_ts, local_ts breaks the tie.
+    split = lo + np.searchsorted(
+        day_data["local_ts"][lo:hi], snapshot_data["local_ts"][0], side="left"
+    )
+    end = split + len(snapshot_data)
 
-    data = buffer[:ptr]
-    order = np.lexsort((data["local_ts"], data["exch_ts"]))
-    return data[order]
+    unified = np.empty(len(snapshot_data) + len(day_data), dtype=DTYPE)
+    unified[:split] = day_data[:split]
+    unified[split:end] = snapshot_data
+    unified[end:] = day_data[split:]
+    return unified
 
 
-def save_npz(filename: str, data: np.ndarray) -> None:
+def save_npz(filename: str, data: np.ndarray, compresslevel: int = 1) -> None:
     """Save event stream in hftbacktest-compatible NPZ format."""
     os.makedirs(os.path.dirname(filename), exist_ok=True)
-    np.savez_compressed(filename, data=data)
+    with zipfile.ZipFile(
+        filename, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=compresslevel
+    ) as archive:
+        with archive.open("data.npy", "w", force_zip64=True) as member:
+            np.lib.format.write_array(member, data, allow_pickle=False)
     print(f"Saved {filename} with shape {data.shape}")
 
 
@@ -219,10 +350,7 @@ if __name__ == "__main__":
         base_exch_ts_ns=1_723_161_256_000_000_000,
     )
 
-    unified_data = np.concatenate((snapshot_data, day_data))
-    unified_data = unified_data[
-        np.lexsort((unified_data["local_ts"], unified_data["exch_ts"]))
-    ]
+    unified_data = merge_snapshot(snapshot_data, day_data)
 
     save_npz(
         os.path.join(output_dir, "part-000.npz"),
@@ -15,6 +15,7 @@ minimal function signatures.
 from __future__ import annotations
 
 import os
+import zipfile
 
 import numpy as np
 from hftbacktest import (
@@ -26,6 +27,15 @@ from hftbacktest import (
     SELL_EVENT,
     TRADE_EVENT,
 )
+from numba import njit, prange
+
+# Event flags written by the generators, combined once at import time.
+_EV_SNAPSHOT_BID = np.uint64(EXCH_EVENT | DEPTH_SNAPSHOT_EVENT | BUY_EVENT)
+_EV_SNAPSHOT_ASK = np.uint64(EXCH_EVENT | DEPTH_SNAPSHOT_EVENT | SELL_EVENT)
+_EV_DEPTH_BID = np.uint64(EXCH_EVENT | LOCAL_EVENT | DEPTH_EVENT | BUY_EVENT)
+_EV_DEPTH_ASK = np.uint64(EXCH_EVENT | LOCAL_EVENT | DEPTH_EVENT | SELL_EVENT)
+_EV_TRADE_BID = np.uint64(EXCH_EVENT | LOCAL_EVENT | TRADE_EVENT | BUY_EVENT)
+_EV_TRADE_ASK = np.uint64(EXCH_EVENT | LOCAL_EVENT | TRADE_EVENT | SELL_EVENT)
 
 # ---------------------------------------------------------------------------
 # dtype used by hftbacktest v2.x
@@ -62,62 +72,181 @@ def make_synthetic_snapshot(
     n_rows = 2 * n_levels
     data = np.zeros(n_rows, dtype=DTYPE)
 
-    bid_flag = EXCH_EVENT | DEPTH_SNAPSHOT_EVENT | BUY_EVENT
-    ask_flag = EXCH_EVENT | DEPTH_SNAPSHOT_EVENT | SELL_EVENT
-
-    # Bid levels
-    for i in range(n_levels):
-        idx = i
-        price = mid_price - (i + 1) * tick_size
-        qty = (i + 1) * lot_size
-
-        data["ev"][idx] = bid_flag
-        data["exch_ts"][idx] = exch_ts
-        data["local_ts"][idx] = local_ts
-        data["px"][idx] = price
-        data["qty"][idx] = qty
-        data["order_id"][idx] = 0
-        data["ival"][idx] = 0
-        data["fval"][idx] = 0.0
-
-    # Ask levels
-    for i in range(n_levels):
-        idx = n_levels + i
-        price = mid_price + (i + 1) * tick_size
-        qty = (i + 1) * lot_size
-
-        data["ev"][idx] = ask_flag
-        data["exch_ts"][idx] = exch_ts
-        data["local_ts"][idx] = local_ts
-        data["px"][idx] = price
-        data["qty"][idx] = qty
-        data["order_id"][idx] = 0
-        data["ival"][idx] = 0
-        data["fval"][idx] = 0.0
+    levels = np.arange(n_levels)
+    offsets = (levels + 1) * tick_size
+    qtys = (levels + 1) * lot_size
+
+    bids = data[:n_levels]
+    bids["ev"] = _EV_SNAPSHOT_BID
+    bids["exch_ts"] = exch_ts
+    bids["local_ts"] = local_ts
+    bids["px"] = mid_price - offsets
+    bids["qty"] = qtys
+
+    asks = data[n_levels:]
+    asks["ev"] = _EV_SNAPSHOT_ASK
+    asks["exch_ts"] = exch_ts
+    asks["local_ts"] = local_ts
+    asks["px"] = mid_price + offsets
+    asks["qty"] = qtys
 
     return data
 
 
-def _depth_profile_qty(
-    level: int,
+def _depth_profile_qty_vec(
+    levels: np.ndarray,
     base_qty: float,
     profile: str = "linear",
-) -> float:
+) -> np.ndarray:
     """
-    Compute quantity for a given depth level.
+    Compute quantities for an array of depth levels.
 
     profile:
         - "flat": same qty on all levels
         - "linear": grows linearly with depth
         - "exp": decays exponentially with depth
     """
-    if profile == "flat":
-        return base_qty
+    levels = levels.astype(np.float64)
     if profile == "linear":
-        return base_qty * (level + 1)
+        return base_qty * (levels + 1.0)
     if profile == "exp":
-        return base_qty * np.exp(-level / 4.0)
-    return base_qty
+        return base_qty * np.exp(-levels / 4.0)
+    return np.full_like(levels, base_qty)
+
+
+_REGIME_MEAN_REVERT = 0
+_REGIME_TREND_UP = 1
+_REGIME_TREND_DOWN = 2
+
+
+@njit(cache=True)
+def _simulate_mid_path(
+    regimes: np.ndarray,
+    sigmas: np.ndarray,
+    noise: np.ndarray,
+    base_price: float,
+    tick_size: float,
+    trend_strength_ticks: float,
+    mean_reversion_strength: float,
+) -> np.ndarray:
+    """
+    Integrate the mid price over all steps.
+
+    The mean-reverting drift depends on the previous mid, so the recurrence is
+    inherently sequential; it is compiled instead of vectorized.
+    """
+    n_steps = noise.shape[0]
+    mid_path = np.empty(n_steps, dtype=np.float64)
+    mid = base_price
+
+    for step in range(n_steps):
+        regime = regimes[step]
+        if regime == _REGIME_MEAN_REVERT:
+            diff_ticks = (mid - base_price) / tick_size
+            drift_ticks = -mean_reversion_strength * diff_ticks
+        elif regime == _REGIME_TREND_UP:
+            drift_ticks = trend_strength_ticks
+        else:
+            drift_ticks = -trend_strength_ticks
+
+        mid += (drift_ticks + sigmas[step] * noise[step]) * tick_size
+        mid = max(tick_size, mid)
+        mid_path[step] = mid
+
+    return mid_path
+
+
+@njit(cache=True, parallel=True)
+def _fill_events(
+    ev: np.ndarray,
+    exch_ts: np.ndarray,
+    local_ts: np.ndarray,
+    px: np.ndarray,
+    qty: np.ndarray,
+    best_bids: np.ndarray,
+    best_asks: np.ndarray,
+    level_offsets: np.ndarray,
+    level_qtys: np.ndarray,
+    step_starts: np.ndarray,
+    n_trades: np.ndarray,
+    trade_is_buy: np.ndarray,
+    trade_lots: np.ndarray,
+    base_exch_ts_ns: int,
+    interval_ns: int,
+    feed_latency_ns: int,
+    lot_size: float,
+) -> None:
+    """
+    Write depth and trade rows for every step into the per-field arrays.
+
+    Per step, bid and ask depth rows alternate per level (bid0, ask0, bid1,
+    ask1, ...) and are followed by that step's trades. Step `i` owns rows
+    `step_starts[i]:step_starts[i + 1]`, so steps are filled in parallel.
+    """
+    n_steps = best_bids.shape[0]
+    n_levels = level_offsets.shape[0]
+
+    for step in prange(n_steps):
+        ptr = step_starts[step]
+        step_exch_ts = base_exch_ts_ns + step * interval_ns
+        step_local_ts = step_exch_ts + feed_latency_ns
+        best_bid = best_bids[step]
+        best_ask = best_asks[step]
+
+        for level in range(n_levels):
+            ev[ptr] = _EV_DEPTH_BID
+            exch_ts[ptr] = step_exch_ts
+            local_ts[ptr] = step_local_ts
+            px[ptr] = best_bid - level_offsets[level]
+            qty[ptr] = level_qtys[level]
+            ptr += 1
+
+            ev[ptr] = _EV_DEPTH_ASK
+            exch_ts[ptr] = step_exch_ts
+            local_ts[ptr] = step_local_ts
+            px[ptr] = best_ask + level_offsets[level]
+            qty[ptr] = level_qtys[level]
+            ptr += 1
+
+        for trade in range(n_trades[step]):
+            if trade_is_buy[step, trade]:
+                ev[ptr] = _EV_TRADE_BID
+                px[ptr] = best_ask
+            else:
+                ev[ptr] = _EV_TRADE_ASK
+                px[ptr] = best_bid
+            exch_ts[ptr] = step_exch_ts
+            local_ts[ptr] = step_local_ts
+            qty[ptr] = trade_lots[step, trade] * lot_size
+            ptr += 1
+
+
+@njit(cache=True, parallel=True)
+def _pack_events(
+    out: np.ndarray,
+    ev: np.ndarray,
+    exch_ts: np.ndarray,
+    local_ts: np.ndarray,
+    px: np.ndarray,
+    qty: np.ndarray,
+) -> None:
+    """
+    Copy per-field scratch arrays into the hftbacktest record layout.
+
+    Rows are written one record at a time so every 64-byte record is
+    touched once, instead of once per field as with per-field assignment.
+    Fields the generator does not use are zeroed here.
+    """
+    for i in prange(out.shape[0]):
+        row = out[i]
+        row["ev"] = ev[i]
+        row["exch_ts"] = exch_ts[i]
+        row["local_ts"] = local_ts[i]
+        row["px"] = px[i]
+        row["qty"] = qty[i]
+        row["order_id"] = 0
+        row["ival"] = 0
+        row["fval"] = 0.0
 
 
 def make_synthetic_day(
@@ -143,105 +272,116 @@ def make_synthetic_day(
     """
     Synthetic trading day generator producing L2 depth and trades.
     All prices and quantities are stored in integer tick / lot units.
+    Events are emitted already ordered by (exch_ts, local_ts).
     """
     rng = np.random.default_rng(42)
 
-    max_events_per_step = 2 * n_levels + max_trades_per_step
-    data = np.zeros(n_steps * max_events_per_step, dtype=DTYPE)
-    ptr = 0
-
-    mid = base_price
-    regimes = np.array(["mean_revert", "trend_up", "trend_down"])
-    regime = "mean_revert"
-    vol_state = "low"
-
-    for step in range(n_steps):
-        if rng.random() < regime_switch_prob:
-            regime = rng.choice(regimes)
-
-        if rng.random() < volatility_switch_prob:
-            vol_state = "high" if vol_state == "low" else "low"
-
-        sigma_ticks = sigma_low_ticks if vol_state == "low" else sigma_high_ticks
-
-        if regime == "mean_revert":
-            diff_ticks = (mid - base_price) / tick_size
-            drift_ticks = -mean_reversion_strength * diff_ticks
-        elif regime == "trend_up":
-            drift_ticks = trend_strength_ticks
-        else:
-            drift_ticks = -trend_strength_ticks
-
-        mid += (drift_ticks + rng.normal(scale=sigma_ticks)) * tick_size
-        mid = max(tick_size, mid)
-
-        exch_ts = base_exch_ts_ns + step * interval_ns
-        local_ts = exch_ts + feed_latency_ns
-
-        mid_rounded = np.round(mid / tick_size) * tick_size
-        best_bid = mid_rounded - tick_size
-        best_ask = best_bid + tick_size
-
-        for level in range(n_levels):
-            bid_px = best_bid - level * tick_size
-            bid_qty = _depth_profile_qty(level, lot_size, depth_profile)
-
-            data["ev"][ptr] = EXCH_EVENT | LOCAL_EVENT | DEPTH_EVENT | BUY_EVENT
-            data["exch_ts"][ptr] = exch_ts
-            data["local_ts"][ptr] = local_ts
-            data["px"][ptr] = bid_px
-            data["qty"][ptr] = bid_qty
-            data["order_id"][ptr] = 0
-            data["ival"][ptr] = 0
-            data["fval"][ptr] = 0.0
-            ptr += 1
-
-            ask_px = best_ask + level * tick_size
-            ask_qty = _depth_profile_qty(level, lot_size, depth_profile)
-
-            data["ev"][ptr] = EXCH_EVENT | LOCAL_EVENT | DEPTH_EVENT | SELL_EVENT
-            data["exch_ts"][ptr] = exch_ts
-            data["local_ts"][ptr] = local_ts
-            data["px"][ptr] = ask_px
-            data["qty"][ptr] = ask_qty
-            data["order_id"][ptr] = 0
-            data["ival"][ptr] = 0
-            data["fval"][ptr] = 0.0
-            ptr += 1
-
-        n_trades = 0
-        while n_trades < max_trades_per_step and rng.random() < trade_prob:
-            side_is_buy = rng.random() < 0.5
-            flag_side = BUY_EVENT if side_is_buy else SELL_EVENT
-            ev_flag = EXCH_EVENT | LOCAL_EVENT | TRADE_EVENT | flag_side
-
-            trade_px = best_ask if side_is_buy else best_bid
-            trade_qty = rng.integers(1, 11) * lot_size
+    # Per-level price offsets and quantities do not depend on the step.
+    levels = np.arange(n_levels)
+    level_offsets = levels * tick_size
+    level_qtys = _depth_profile_qty_vec(levels, lot_size, depth_profile)
+
+    # Draw all randomness up front so the row-fill loop only indexes arrays.
+    regime_switch = rng.random(n_steps) < regime_switch_prob
+    volatility_switch = rng.random(n_steps) < volatility_switch_prob
+    noise = rng.standard_normal(n_steps)
+    trade_draws = rng.random((n_steps, max_trades_per_step)) < trade_prob
+    trade_is_buy = rng.random((n_steps, max_trades_per_step)) < 0.5
+    trade_lots = rng.integers(1, 11, size=(n_steps, max_trades_per_step))
+
+    # Each step keeps the regime chosen at the most recent switch.
+    switch_steps = np.flatnonzero(regime_switch)
+    regime_choices = np.concatenate(
+        (
+            [_REGIME_MEAN_REVERT],
+            rng.integers(0, 3, size=switch_steps.size),
+        )
+    )
+    last_switch = np.zeros(n_steps, dtype=np.int64)
+    last_switch[switch_steps] = np.arange(1, switch_steps.size + 1)
+    regimes = regime_choices[np.maximum.accumulate(last_switch)]
+
+    # Volatility toggles between low and high on every switch.
+    high_vol = np.cumsum(volatility_switch) % 2 == 1
+    sigmas = np.where(high_vol, sigma_high_ticks, sigma_low_ticks)
+
+    mid_path = _simulate_mid_path(
+        regimes,
+        sigmas,
+        noise,
+        base_price,
+        tick_size,
+        trend_strength_ticks,
+        mean_reversion_strength,
+    )
+    best_bids = np.round(mid_path / tick_size) * tick_size - tick_size
+    best_asks = best_bids + tick_size
+
+    # A step keeps trading while consecutive draws stay below trade_prob.
+    n_trades = np.cumprod(trade_draws, axis=1).sum(axis=1)
+
+    # Step i owns output rows step_starts[i]:step_starts[i + 1]; with the
+    # offsets known up front the fill needs no shared write cursor and the
+    # output needs no compaction.
+    step_starts = np.zeros(n_steps + 1, dtype=np.int64)
+    np.cumsum(2 * n_levels + n_trades, out=step_starts[1:])
+    n_rows = int(step_starts[-1])
+
+    ev = np.empty(n_rows, dtype=np.uint64)
+    exch_ts = np.empty(n_rows, dtype=np.int64)
+    local_ts = np.empty(n_rows, dtype=np.int64)
+    px = np.empty(n_rows, dtype=np.float64)
+    qty = np.empty(n_rows, dtype=np.float64)
+
+    _fill_events(
+        ev,
+        exch_ts,
+        local_ts,
+        px,
+        qty,
+        best_bids,
+        best_asks,
+        level_offsets,
+        level_qtys,
+        step_starts,
+        n_trades,
+        trade_is_buy,
+        trade_lots,
+        base_exch_ts_ns,
+        interval_ns,
+        feed_latency_ns,
+        lot_size,
+    )
 
-            data["ev"][ptr] = ev_flag
-            data["exch_ts"][ptr] = exch_ts
-            data["local_ts"][ptr] = local_ts
-            data["px"][ptr] = trade_px
-            data["qty"][ptr] = trade_qty
-            data["order_id"][ptr] = 0
-            data["ival"][ptr] = 0
-            data["fval"][ptr] = 0.0
+    # Steps are written in time order and all rows of a step share their
+    # timestamps, so the stream needs no sort.
+    assert np.all(np.diff(exch_ts) >= 0)
 
-            ptr += 1
-            n_trades += 1
+    data = np.empty(n_rows, dtype=DTYPE)
+    _pack_events(data, ev, exch_ts, local_ts, px, qty)
+    return data
 
-    data = data[:ptr]
-    sort_idx = np.lexsort((data["local_ts"], data["exch_ts"]))
-    return data[sort_idx]
 
+def save_npz(
+    filename: str,
+    data: np.ndarray,
+    compress: bool = True,
+    compresslevel: int = 1,
+) -> None:
+    """
+    Save data in hftbacktest-compatible NPZ format.
 
-def save_npz(filename: str, data: np.ndarray, compress: bool = True) -> None:
-    """Save data in hftbacktest-compatible NPZ format."""
+    The array is streamed into the archive member instead of going through
+    np.savez_compressed, which always uses zlib's default (slow) level.
+    hftbacktest only reads NPZ, so the container stays a DEFLATE zip.
+    """
     os.makedirs(os.path.dirname(filename), exist_ok=True)
-    if compress:
-        np.savez_compressed(filename, data=data)
-    else:
-        np.savez(filename, data=data)
+    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    with zipfile.ZipFile(
+        filename, "w", compression=compression, compresslevel=compresslevel
+    ) as archive:
+        with archive.open("data.npy", "w", force_zip64=True) as member:
+            np.lib.format.write_array(member, data, allow_pickle=False)
     print(f"Saved {filename} with shape {data.shape}")
 
 
@@ -9,6 +9,8 @@ analysis and debugging.
 from __future__ import annotations
 
 import os
+import struct
+import zipfile
 from typing import Mapping
 
 import matplotlib.pyplot as plt
@@ -20,6 +22,7 @@ from hftbacktest import (
     SELL_EVENT,
     TRADE_EVENT,
 )
+from numba import njit
 
 # ---------------------------------------------------------------------
 # Event filter configuration
@@ -49,6 +52,31 @@ EVENT_FILTERS: Mapping[str, int] = {
     "snapshot_ask": DEPTH_SNAPSHOT_EVENT | SELL_EVENT,
 }
 
+# Renderer settings for long price series. Agg drops vertices that deviate
+# less than ~1 pixel from the simplified path and rasterizes long lines in
+# chunks, which keeps multi-million point feeds fast to plot without a
+# visible difference.
+_PLOT_RC_PARAMS: Mapping[str, object] = {
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10_000,
+}
+
+
+@njit(cache=True)
+def _match_any_event(ev: np.ndarray, masks: np.ndarray) -> np.ndarray:
+    """Single pass over `ev`: True where all bits of at least one mask are set."""
+    n_rows = ev.shape[0]
+    n_masks = masks.shape[0]
+    out = np.zeros(n_rows, dtype=np.bool_)
+    for i in range(n_rows):
+        code = ev[i]
+        for j in range(n_masks):
+            if code & masks[j] == masks[j]:
+                out[i] = True
+                break
+    return out
+
 
 def _filter_by_event(data, filter_name):
     """
@@ -60,16 +88,82 @@ def _filter_by_event(data, filter_name):
     else:
         filter_names = list(filter_name)
 
-    masks = []
     for name in filter_names:
         if name not in EVENT_FILTERS:
             available = ", ".join(sorted(EVENT_FILTERS.keys()))
             raise ValueError(f"Unknown filter '{name}'. Available: {available}")
-        bits = EVENT_FILTERS[name]
-        masks.append((data["ev"] & bits) == bits)
 
-    # OR-combine all masks → row is included if it matches ANY filter
-    return np.logical_or.reduce(masks)
+    masks = np.array([EVENT_FILTERS[name] for name in filter_names], dtype=np.uint64)
+
+    # All filters are evaluated in one pass over the "ev" column instead of
+    # building and OR-reducing one mask per filter.
+    return _match_any_event(data["ev"], masks)
+
+
+def _map_stored_npz_member(path: str, key: str):
+    """
+    Memory-map an uncompressed (ZIP_STORED) NPZ member in place.
+
+    A stored member is the raw NPY file embedded in the archive, so only the
+    zip local header and the NPY header need to be parsed to locate the
+    array data. Returns None when the member is missing or compressed.
+    """
+    member_name = f"{key}.npy"
+    with zipfile.ZipFile(path) as archive:
+        if member_name not in archive.namelist():
+            return None
+        info = archive.getinfo(member_name)
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+
+    with open(path, "rb") as fh:
+        # Local file header: fixed 30 bytes, then file name and extra field.
+        fh.seek(info.header_offset)
+        local_header = fh.read(30)
+        name_len, extra_len = struct.unpack("<HH", local_header[26:30])
+        fh.seek(info.header_offset + 30 + name_len + extra_len)
+
+        version = np.lib.format.read_magic(fh)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(fh)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(fh)
+        data_offset = fh.tell()
+
+    if dtype.hasobject:
+        return None
+    return np.memmap(
+        path,
+        dtype=dtype,
+        mode="r",
+        offset=data_offset,
+        shape=shape,
+        order="F" if fortran_order else "C",
+    )
+
+
+def _load_array(path: str, key: str):
+    """
+    Load the event array from an NPZ archive or a plain NPY file.
+
+    NPY files and uncompressed NPZ members are memory-mapped, so slicing the
+    first rows or reading the first/last timestamp only touches the pages
+    involved. Compressed NPZ members are always decompressed in full.
+    """
+    if path.endswith(".npy"):
+        return np.load(path, mmap_mode="r")
+
+    mapped = _map_stored_npz_member(path, key)
+    if mapped is not None:
+        return mapped
+
+    npz = np.load(path)
+    if key not in npz.files:
+        raise KeyError(
+            f"Key '{key}' not found in NPZ file. "
+            f"Available keys: {list(npz.files)}"
+        )
+    return npz[key]
 
 
 def peek_data(
@@ -78,25 +172,19 @@ def peek_data(
     n: int = 15,
     ) -> None:
     """
-    Print basic information and the first `n` rows of an NPZ dataset.
+    Print basic information and the first `n` rows of an NPZ or NPY dataset.
 
     Parameters
     ----------
     path : str, optional
-        Path to the NPZ file, by default "data/btcusdt_20240809.npz".
+        Path to the NPZ or NPY file, by default "data/btcusdt_20240809.npz".
+        NPY files are memory-mapped instead of loaded.
     key : str, optional
-        Array key inside the NPZ file, by default "data".
+        Array key inside the NPZ file, by default "data". Ignored for NPY.
     n : int, optional
         Number of rows to print from the start of the array, by default 15.
     """
-    npz = np.load(path)
-    if key not in npz.files:
-        raise KeyError(
-            f"Key '{key}' not found in NPZ file. "
-            f"Available keys: {list(npz.files)}"
-        )
-
-    data = npz[key]
+    data = _load_array(path, key)
     print("file:", path)
     print("dtype:", data.dtype)
     print("shape:", data.shape)
@@ -181,9 +269,9 @@ def plot_price_series(
     Parameters
     ----------
     path : str, optional
-        Path to the NPZ file, by default "data/btcusdt_20240809.npz".
+        Path to the NPZ or NPY file, by default "data/btcusdt_20240809.npz".
     key : str, optional
-        Array key inside the NPZ file, by default "data".
+        Array key inside the NPZ file, by default "data". Ignored for NPY.
     ts_field : str, optional
         Name of the timestamp field, by default "exch_ts".
     px_field : str, optional
@@ -193,14 +281,7 @@ def plot_price_series(
     output_path : str or None, optional
         Output PNG filename. If None, a name is derived from `path` and `event_filter`.
     """
-    npz = np.load(path)
-    if key not in npz.files:
-        raise KeyError(
-            f"Key '{key}' not found in NPZ file. "
-            f"Available keys: {list(npz.files)}"
-        )
-
-    data = npz[key]
+    data = _load_array(path, key)
 
     if ts_field not in data.dtype.names:
         raise KeyError(
@@ -213,22 +294,25 @@ def plot_price_series(
             f"Available fields: {data.dtype.names}"
         )
 
+    # Column views into the record array; filtering copies only these two
+    # columns instead of every field of the matching rows.
+    ts = data[ts_field]
+    px = data[px_field]
+
     # Optionally filter by event type using human-friendly name
     if event_filter is not None:
         mask = _filter_by_event(data, event_filter)
-        data = data[mask]
-        if data.size == 0:
+        ts = ts[mask]
+        px = px[mask]
+        if ts.size == 0:
             raise ValueError(
                 f"No rows match event filter '{event_filter}'. "
                 "Try a different filter or inspect EVENT_FILTERS."
             )
 
-    if data.size == 0:
+    if ts.size == 0:
         raise ValueError("No rows in data array, nothing to plot.")
 
-    ts = data[ts_field]
-    px = data[px_field]
-
     # Convert nanoseconds to seconds and make it relative to the first timestamp
     t_sec = (ts - ts[0]) / 1e9
 
@@ -243,15 +327,16 @@ def plot_price_series(
     title = f"Price series ({px_field}) from {os.path.basename(path)}\nfilter: {filter_label}"
 
     # Create and save the plot
-    plt.figure(figsize=(14, 6))
-    plt.plot(t_sec, px)
-    plt.title(title)
-    plt.xlabel("Time (s, relative to first event)")
-    plt.ylabel("Price")
-    plt.grid(True)
-    plt.tight_layout()
-    plt.savefig(output_path)
-    plt.close()
+    with plt.rc_context(_PLOT_RC_PARAMS):
+        plt.figure(figsize=(14, 6))
+        plt.plot(t_sec, px)
+        plt.title(title)
+        plt.xlabel("Time (s, relative to first event)")
+        plt.ylabel("Price")
+        plt.grid(True)
+        plt.tight_layout()
+        plt.savefig(output_path)
+        plt.close()
     print(f"Saved price plot to: {output_path}")
 
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import pytest
 from tradingchassis_core.core.domain.types import (
     BookLevel,
     BookPayload,
@@ -81,3 +82,194 @@ def test_debug_strategy_uses_clean_state_busy_checks_without_legacy_method() ->
 
     assert len(intents) == 2
     assert all(intent.intent_type == "new" for intent in intents)
+
+
+def _one_level_book_event(ts_ns: int) -> MarketEvent:
+    return MarketEvent(
+        ts_ns_exch=ts_ns,
+        ts_ns_local=ts_ns,
+        instrument="BTC_USDC-PERPETUAL",
+        event_type="book",
+        book=BookPayload(
+            book_type="snapshot",
+            bids=(
+                BookLevel(
+                    price=Price(currency="UNKNOWN", value=100.0),
+                    quantity=Quantity(value=1.0, unit="contracts"),
+                ),
+            ),
+            asks=(
+                BookLevel(
+                    price=Price(currency="UNKNOWN", value=101.0),
+                    quantity=Quantity(value=1.0, unit="contracts"),
+                ),
+            ),
+            depth=1,
+        ),
+    )
+
+
+def test_debug_strategy_skips_unchanged_ladder_when_all_slots_busy() -> None:
+    strategy = DebugStrategyV1(
+        spread=5.0,
+        order_qty=0.1,
+        use_price_tick_levels=1,
+        post_only=True,
+    )
+    constraints = RiskConstraints(
+        ts_ns_local=1,
+        scope="test",
+        trading_enabled=True,
+    )
+
+    def feed(ts_ns: int, *, busy: bool = True) -> list[str]:
+        intents = strategy.on_feed(
+            state=_StateStub(busy=busy),  # type: ignore[arg-type]
+            event=_one_level_book_event(ts_ns),
+            engine_cfg=_EngineCfgStub(),
+            constraints=constraints,
+        )
+        return [intent.intent_type for intent in intents]
+
+    assert feed(1) == ["replace", "replace"]
+
+    # Rejected by risk or failed in execution: never reported as dispatched.
+    assert feed(2) == ["replace", "replace"]
+
+    # Only part of the ladder went out.
+    strategy.on_intents_dispatched(strategy.intents_on_event[:1])
+    assert feed(3) == ["replace", "replace"]
+
+    # The whole ladder went out; an identical ladder is now redundant.
+    strategy.on_intents_dispatched(strategy.intents_on_event)
+    assert feed(4) == []
+
+    # A new order size has to go out even though prices are unchanged.
+    strategy.order_qty = 0.2
+    assert feed(5) == ["replace", "replace"]
+    strategy.on_intents_dispatched(strategy.intents_on_event)
+    assert feed(6) == []
+
+    # Order feedback may have changed what is resting, so quote again once.
+    strategy.on_order_update(
+        state=_StateStub(busy=True),  # type: ignore[arg-type]
+        engine_cfg=_EngineCfgStub(),
+        constraints=constraints,
+    )
+    assert feed(7) == ["replace", "replace"]
+
+    assert feed(8, busy=False) == ["new", "new"]
+
+
+def test_debug_strategy_extrapolated_levels_step_one_tick_from_rounded_base() -> None:
+    # mid = 100.5 and half spread = 1.0 put both ladder bases on a half tick
+    # (99.5 / 101.5); the tie is resolved once (round-half-even) and every deeper
+    # level then steps exactly one tick.
+    strategy = DebugStrategyV1(
+        spread=2.0,
+        order_qty=0.1,
+        use_price_tick_levels=3,
+        post_only=True,
+    )
+
+    intents = strategy.on_feed(
+        state=_StateStub(busy=False),  # type: ignore[arg-type]
+        event=_one_level_book_event(1),
+        engine_cfg=_EngineCfgStub(tick_size=1.0),
+        constraints=RiskConstraints(ts_ns_local=1, scope="test", trading_enabled=True),
+    )
+
+    bid_prices = [intent.intended_price.value for intent in intents if intent.side == "buy"]
+    ask_prices = [intent.intended_price.value for intent in intents if intent.side == "sell"]
+    assert bid_prices == [100.0, 99.0, 98.0]
+    assert ask_prices == [101.0, 103.0, 104.0]
+
+
+@pytest.mark.parametrize(
+    ("best_bid", "tick_size"),
+    [
+        (float("nan"), 0.1),
+        (float("inf"), 0.1),
+        (1e300, 0.1),
+        (100.0, float("nan")),
+        (100.0, float("inf")),
+        (100.0, 0.0),
+    ],
+)
+def test_debug_strategy_rejects_non_finite_or_unrepresentable_quotes(
+    best_bid: float, tick_size: float
+) -> None:
+    strategy = DebugStrategyV1(
+        spread=5.0,
+        order_qty=0.1,
+        use_price_tick_levels=2,
+        post_only=True,
+    )
+    event = MarketEvent(
+        ts_ns_exch=1,
+        ts_ns_local=1,
+        instrument="BTC_USDC-PERPETUAL",
+        event_type="book",
+        book=BookPayload(
+            book_type="snapshot",
+            bids=(
+                BookLevel(
+                    price=Price(currency="UNKNOWN", value=best_bid),
+                    quantity=Quantity(value=1.0, unit="contracts"),
+                ),
+            ),
+            asks=(
+                BookLevel(
+                    price=Price(currency="UNKNOWN", value=101.0),
+                    quantity=Quantity(value=1.0, unit="contracts"),
+                ),
+            ),
+            depth=1,
+        ),
+    )
+
+    with pytest.raises(ValueError):
+        strategy.on_feed(
+            state=_StateStub(busy=False),  # type: ignore[arg-type]
+            event=event,
+            engine_cfg=_EngineCfgStub(tick_size=tick_size),
+            constraints=RiskConstraints(ts_ns_local=1, scope="test", trading_enabled=True),
+        )
+
+
+def test_debug_strategy_time_in_force_follows_post_only_after_construction() -> None:
+    strategy = DebugStrategyV1(
+        spread=5.0,
+        order_qty=0.1,
+        use_price_tick_levels=1,
+        post_only=True,
+    )
+    strategy.post_only = False
+
+    intents = strategy.on_feed(
+        state=_StateStub(busy=False),  # type: ignore[arg-type]
+        event=_one_level_book_event(1),
+        engine_cfg=_EngineCfgStub(),
+        constraints=RiskConstraints(ts_ns_local=1, scope="test", trading_enabled=True),
+    )
+
+    assert [intent.time_in_force for intent in intents] == ["GTC", "GTC"]
+
+
+def test_debug_strategy_order_qty_follows_attribute_after_construction() -> None:
+    strategy = DebugStrategyV1(
+        spread=5.0,
+        order_qty=0.1,
+        use_price_tick_levels=1,
+        post_only=True,
+    )
+    strategy.order_qty = 0.25
+
+    intents = strategy.on_feed(
+        state=_StateStub(busy=False),  # type: ignore[arg-type]
+        event=_one_level_book_event(1),
+        engine_cfg=_EngineCfgStub(),
+        constraints=RiskConstraints(ts_ns_local=1, scope="test", trading_enabled=True),
+    )
+
+    assert [intent.intended_qty.value for intent in intents] == [0.25, 0.25]
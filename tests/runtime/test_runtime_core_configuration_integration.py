@@ -73,6 +73,17 @@ def test_local_loader_succeeds_with_valid_core() -> None:
     assert cfg.core_cfg.version == "v1"
 
 
+def test_local_loader_returns_independent_configs_for_repeated_loads() -> None:
+    sample_path = _repo_root() / "core_runtime/local/bt_config_local.json"
+    first = load_config(str(sample_path))
+    first.engine_cfg.data_files.append("mutated.npz")
+
+    second = load_config(str(sample_path))
+
+    assert "mutated.npz" not in second.engine_cfg.data_files
+    assert second.engine_cfg.data_files is not first.engine_cfg.data_files
+
+
 def test_argo_entrypoint_rejects_invalid_run_config_before_planning(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
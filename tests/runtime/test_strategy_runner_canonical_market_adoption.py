@@ -314,6 +314,35 @@ def test_successful_new_dispatch_does_not_leave_stale_inflight() -> None:
     assert runner.strategy_state.has_inflight("BTC_USDC-PERPETUAL", "new-1") is False
 
 
+def test_dispatch_reports_only_successful_intents_to_strategy_hook() -> None:
+    class _HookStrategy(_Strategy):
+        def __init__(self) -> None:
+            super().__init__()
+            self.dispatched: list[list[Any]] = []
+
+        def on_intents_dispatched(self, intents: list[Any]) -> None:
+            self.dispatched.append(list(intents))
+
+    class _FailingExecution(_Execution):
+        def apply_intents(self, intents: list[Any]) -> list[tuple[Any, str]]:
+            super().apply_intents(intents)
+            return [(intents[0], "EXCHANGE_REJECT")]
+
+    strategy = _HookStrategy()
+    runner = HftStrategyRunner(
+        engine_cfg=_engine_cfg(),
+        strategy=strategy,
+        risk_cfg=_risk_cfg(),
+        core_cfg=_core_cfg(),
+    )
+    failed = _new_intent(ts_ns_local=2, client_order_id="new-1")
+    sent = _new_intent(ts_ns_local=2, client_order_id="new-2")
+
+    runner._dispatch_accepted_intents([failed, sent], _FailingExecution(), sim_now_ns=2)
+
+    assert strategy.dispatched == [[sent]]
+
+
 def test_runner_source_has_no_removed_compat_api_usage() -> None:
     source = inspect.getsource(strategy_runner_module)
     assert "decide_intents" not in source